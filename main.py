@@ -1,10 +1,20 @@
 import os
-import json
+import functools
+import select
+import shutil
 import subprocess
-from flask import Flask, render_template_string, request, jsonify
+import sys
+import tempfile
+import time
+import traceback
+import webbrowser
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+import orjson
 import signal
 from pathlib import Path
-import psutil
 
 from modules.validate_xpath import validate_json_file
 from modules.reporting_v2 import RobustReporting
@@ -12,10 +22,29 @@ from modules.reporting_v2 import RobustReporting
 # Initialize reporting
 rr = RobustReporting()
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (compact output, keys kept in insertion order)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 CAPTURED_XPATHS_DIR = os.path.join(os.path.dirname(__file__), 'captured_xpaths')
 TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), 'config', 'xpath_ui_template.html')
+# Display order of page files, maintained by /api/reorder_files
+ORDER_MANIFEST = '_order.json'
 
 def load_template():
     # Robustly load template; fallback to a minimal inline template if missing
@@ -29,44 +58,173 @@ def load_template():
         rr.log_error(f"Failed to load template {TEMPLATE_PATH}: {e}")
         return "<!doctype html><html><head><meta charset='utf-8'><title>XPath UI</title></head><body><h1>XPath UI</h1><div id='app'></div></body></html>"
 
-def get_all_json_data():
-    data = {}
-    for fname in os.listdir(CAPTURED_XPATHS_DIR):
-        if fname.endswith('.json'):
-            fpath = os.path.join(CAPTURED_XPATHS_DIR, fname)
+def _template_mtime():
+    try:
+        return os.path.getmtime(TEMPLATE_PATH)
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _get_compiled_template(mtime):
+    # Compile once per template revision; the mtime argument is the cache key
+    return app.jinja_env.from_string(load_template())
+
+def _read_json(fpath):
+    with open(fpath, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _read_json_bytes(fpath):
+    # Raw file contents, checked once to be valid JSON so a corrupt page cannot break /api/data
+    with open(fpath, 'rb') as f:
+        raw = f.read()
+    orjson.loads(raw)
+    return raw
+
+def _atomic_write_json(fpath, obj):
+    # Write a uniquely named sibling temp file and swap it in, so neither a crash mid-write
+    # nor a concurrent writer of the same file can leave truncated JSON behind
+    raw = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(fpath), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            # Stat our own temp file; os.replace keeps mtime and size, so this describes
+            # exactly these bytes even if another writer replaces fpath right after us
+            st = os.fstat(f.fileno())
+        # mkstemp creates the file 0600; keep the permissions the page already had
+        if os.path.exists(fpath):
+            shutil.copymode(fpath, tmp)
+        os.replace(tmp, fpath)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return raw, st
+
+def _load_order_manifest():
+    mpath = os.path.join(CAPTURED_XPATHS_DIR, ORDER_MANIFEST)
+    try:
+        return _read_json(mpath)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        rr.log_error(f"Failed to load order manifest {mpath}: {e}")
+        return []
+
+def _save_order_manifest(files):
+    _atomic_write_json(os.path.join(CAPTURED_XPATHS_DIR, ORDER_MANIFEST), files)
+
+def _apply_order(names):
+    # Manifest order first; files missing from it (new captures, no manifest yet) follow alphabetically
+    present = set(names)
+    ordered = [f for f in _load_order_manifest() if f in present]
+    listed = set(ordered)
+    ordered.extend(sorted(f for f in names if f not in listed))
+    return ordered
+
+# Page file contents keyed by file name -> (st_mtime_ns, st_size, raw JSON bytes)
+_json_cache = {}
+# Reads cache-miss page files concurrently; file reads release the GIL
+_read_pool = ThreadPoolExecutor(max_workers=8)
+
+def _scan_json_entries():
+    # DirEntry objects carry name, path and cached type/stat info, saving a stat per file
+    with os.scandir(CAPTURED_XPATHS_DIR) as it:
+        return {e.name: e for e in it
+                if e.name.endswith('.json') and e.name != ORDER_MANIFEST and e.is_file()}
+
+def _scan_pages():
+    # (name, path, stat) for each page file in display order
+    pages = []
+    entries = _scan_json_entries()
+    for fname in _apply_order(list(entries)):
+        entry = entries[fname]
+        try:
+            # Follow symlinks so the cache/ETag key describes the content that is actually read
+            pages.append((fname, entry.path, entry.stat()))
+        except OSError as e:
+            rr.log_error(f"Failed to stat JSON {entry.path}: {e}")
+    return pages
+
+def _pages_etag(pages):
+    # Changes whenever a page is added, removed, renamed, reordered or rewritten
+    sig = repr([(fname, st.st_mtime_ns, st.st_size) for fname, _, st in pages]).encode('utf-8')
+    return f'"{zlib.crc32(sig):x}-{len(pages)}"'
+
+def _iter_page_bytes(pages):
+    # Yield (name, raw JSON bytes) in display order; cache misses are all submitted to the pool up front
+    pending = []
+    for fname, fpath, st in pages:
+        cached = _json_cache.get(fname)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            pending.append((fname, fpath, st, cached[2], None))
+        else:
+            pending.append((fname, fpath, st, None, _read_pool.submit(_read_json_bytes, fpath)))
+    for fname, fpath, st, raw, future in pending:
+        if future is not None:
             try:
-                with open(fpath, 'r', encoding='utf-8') as f:
-                    arr = json.load(f)
-                    data[fname] = arr
+                raw = future.result()
+                _json_cache[fname] = (st.st_mtime_ns, st.st_size, raw)
             except Exception as e:
+                _json_cache.pop(fname, None)
                 rr.log_error(f"Failed to load JSON {fpath}: {e}")
                 continue
-    return data
+        yield fname, raw
+
+def _load_page(fname, fpath):
+    # Decode from the cached bytes when they are still current, skipping the file read
+    cached = _json_cache.get(fname)
+    if cached:
+        st = os.stat(fpath)
+        if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return orjson.loads(cached[2])
+    return _read_json(fpath)
+
+def _store_page(fname, fpath, arr):
+    # Write through to the cache so the next /api/data hit does not re-read the page
+    raw, st = _atomic_write_json(fpath, arr)
+    _json_cache[fname] = (st.st_mtime_ns, st.st_size, raw)
 
 @app.route('/')
 def index():
-    template = load_template()
-    return render_template_string(template)
+    return _get_compiled_template(_template_mtime()).render()
 
 @app.route('/api/data')
 def api_data():
-    return jsonify(get_all_json_data())
+    pages = _scan_pages()
+    etag = _pages_etag(pages)
+    # Nothing changed on disk since the client's copy: skip loading and encoding entirely
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304, {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+    def generate():
+        # Page files are already valid JSON, so pass their bytes through instead of parse + re-encode
+        yield b'{'
+        sep = b''
+        for fname, raw in _iter_page_bytes(pages):
+            yield sep + orjson.dumps(fname) + b':' + raw
+            sep = b','
+        yield b'}'
+
+    return Response(generate(), mimetype='application/json',
+                    headers={'ETag': etag, 'Cache-Control': 'no-cache'})
 
 @app.route('/api/update_name', methods=['POST'])
 def api_update_name():
     try:
-        req = request.json
+        req = request.get_json(cache=True)
         page = req['page']
         idx = req['index']
         new_name = req['name']
         fpath = os.path.join(CAPTURED_XPATHS_DIR, page)
         
-        with open(fpath, 'r', encoding='utf-8') as f:
-            arr = json.load(f)
+        arr = _load_page(page, fpath)
         if 0 <= idx < len(arr):
             arr[idx]['name'] = new_name
-            with open(fpath, 'w', encoding='utf-8') as f:
-                json.dump(arr, f, indent=2, ensure_ascii=False)
+            _store_page(page, fpath, arr)
             return jsonify({'success': True})
         return jsonify({'success': False, 'error': 'Invalid index'})
     except Exception as e:
@@ -75,19 +233,17 @@ def api_update_name():
 @app.route('/api/reorder', methods=['POST'])
 def api_reorder():
     try:
-        req = request.json
+        req = request.get_json(cache=True)
         page = req['page']
         old_index = req['oldIndex']
         new_index = req['newIndex']
         fpath = os.path.join(CAPTURED_XPATHS_DIR, page)
         
-        with open(fpath, 'r', encoding='utf-8') as f:
-            arr = json.load(f)
+        arr = _load_page(page, fpath)
         if 0 <= old_index < len(arr) and 0 <= new_index < len(arr):
             item = arr.pop(old_index)
             arr.insert(new_index, item)
-            with open(fpath, 'w', encoding='utf-8') as f:
-                json.dump(arr, f, indent=2, ensure_ascii=False)
+            _store_page(page, fpath, arr)
             return jsonify({'success': True})
         return jsonify({'success': False, 'error': 'Invalid indices'})
     except Exception as e:
@@ -96,74 +252,133 @@ def api_reorder():
 @app.route('/api/reorder_files', methods=['POST'])
 def api_reorder_files():
     try:
-        req = request.json
+        req = request.get_json(cache=True)
         old_index = req['oldIndex']
         new_index = req['newIndex']
         
-        # Get list of JSON files
-        files = [f for f in os.listdir(CAPTURED_XPATHS_DIR) if f.endswith('.json')]
-        files.sort()
+        # Get list of JSON files in their current display order
+        files = _apply_order(list(_scan_json_entries()))
         
         if 0 <= old_index < len(files) and 0 <= new_index < len(files):
-            file_to_move = files[old_index]
-            files.remove(file_to_move)
+            file_to_move = files.pop(old_index)
             files.insert(new_index, file_to_move)
-            
-            # Update the order by renaming files with temporary names first
-            temp_names = []
-            for i, fname in enumerate(files):
-                old_path = os.path.join(CAPTURED_XPATHS_DIR, fname)
-                temp_name = f"temp_{i}_{fname}"
-                temp_path = os.path.join(CAPTURED_XPATHS_DIR, temp_name)
-                os.rename(old_path, temp_path)
-                temp_names.append(temp_name)
-            
-            # Rename back to original names in the new order
-            for temp_name, final_name in zip(temp_names, files):
-                temp_path = os.path.join(CAPTURED_XPATHS_DIR, temp_name)
-                final_path = os.path.join(CAPTURED_XPATHS_DIR, final_name)
-                os.rename(temp_path, final_path)
-                
+            _save_order_manifest(files)
             return jsonify({'success': True})
         return jsonify({'success': False, 'error': 'Invalid indices'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-    return jsonify({'success': False, 'error': 'Invalid index'})
 
 # Update globals
 capture_process = None
 capture_active = False
-selenium_start_time = None
-selenium_browser_pids = set()
 ui_browser_pid = None
 ui_browser_start_time = None
+# Windows Job Object holding the capture subprocess and everything it starts
+capture_job = None
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+
+    class _IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_ulonglong) for name in (
+            'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+            'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+
+    class _JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [('PerProcessUserTimeLimit', ctypes.c_int64),
+                    ('PerJobUserTimeLimit', ctypes.c_int64),
+                    ('LimitFlags', wintypes.DWORD),
+                    ('MinimumWorkingSetSize', ctypes.c_size_t),
+                    ('MaximumWorkingSetSize', ctypes.c_size_t),
+                    ('ActiveProcessLimit', wintypes.DWORD),
+                    ('Affinity', ctypes.c_size_t),
+                    ('PriorityClass', wintypes.DWORD),
+                    ('SchedulingClass', wintypes.DWORD)]
+
+    class _JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [('BasicLimitInformation', _JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                    ('IoInfo', _IO_COUNTERS),
+                    ('ProcessMemoryLimit', ctypes.c_size_t),
+                    ('JobMemoryLimit', ctypes.c_size_t),
+                    ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                    ('PeakJobMemoryUsed', ctypes.c_size_t)]
+
+    _JobObjectExtendedLimitInformation = 9
+    _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+    _kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    _kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    _kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    _kernel32.TerminateJobObject.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+def _create_capture_job(proc):
+    # Processes started by a job member join the job, so the driver and browsers are covered.
+    # Kill-on-close also takes the tree down if this app dies without cleaning up.
+    job = _kernel32.CreateJobObjectW(None, None)
+    if not job:
+        raise ctypes.WinError(ctypes.get_last_error())
+    info = _JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+    if not (_kernel32.SetInformationJobObject(job, _JobObjectExtendedLimitInformation,
+                                              ctypes.byref(info), ctypes.sizeof(info))
+            and _kernel32.AssignProcessToJobObject(job, int(proc._handle))):
+        err = ctypes.get_last_error()
+        _kernel32.CloseHandle(job)
+        raise ctypes.WinError(err)
+    return job
 
 def cleanup_selenium_processes():
-    import psutil
+    # Kill the capture subprocess's whole tree (driver, Selenium browsers), including processes
+    # orphaned by a capture subprocess that already exited, without enumerating system processes.
+    # The UI browser is never part of this tree.
+    global capture_job
     try:
-        # Only kill processes we know are from Selenium
-        for pid in selenium_browser_pids:
+        if os.name == 'nt':
+            if capture_job:
+                _kernel32.TerminateJobObject(capture_job, 1)
+                _kernel32.CloseHandle(capture_job)
+                capture_job = None
+        elif capture_process:
+            # The capture subprocess leads its own session, so its pid is the group id;
+            # the group outlives the leader while any orphaned member is alive
             try:
-                proc = psutil.Process(pid)
-                if proc.is_running() and pid != ui_browser_pid:  # Don't kill UI browser
-                    proc.kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        
-        # Kill selenium drivers
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                pname = proc.name().lower()
-                # Only target msedgedriver.exe as primary driver; also keep fallback to known drivers for safety
-                if any(driver in pname for driver in ['msedgedriver']):
-                    proc.kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+                os.killpg(capture_process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
     except Exception as e:
         rr.log_error(f"cleanup_selenium_processes error: {e}")
 
+def _wait_proc(proc, timeout):
+    # Sleep on a kernel handle until the process exits instead of Popen.wait's poll/sleep loop.
+    # Returns True if the process exited within timeout seconds.
+    if proc.poll() is not None:
+        return True
+    try:
+        if os.name == 'nt':
+            import ctypes
+            ctypes.windll.kernel32.WaitForSingleObject(int(proc._handle), int(timeout * 1000))
+            return proc.poll() is not None
+        if hasattr(os, 'pidfd_open'):
+            fd = os.pidfd_open(proc.pid)
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.poll(int(timeout * 1000))
+            finally:
+                os.close(fd)
+            return proc.poll() is not None
+    except (OSError, AttributeError):
+        pass  # pidfd_open needs Linux >= 5.3; fall back to Popen.wait
+    try:
+        proc.wait(timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
+
 def signal_handler(signum, frame):
     print("\nCleaning up before exit...")
     try:
@@ -173,22 +388,49 @@ def signal_handler(signum, frame):
     if capture_process and capture_process.poll() is None:
         try:
             capture_process.terminate()
-            try:
-                capture_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not _wait_proc(capture_process, 5):
                 capture_process.kill()
         except Exception as e:
             rr.log_error(f"Error terminating capture_process in signal_handler: {e}")
     print("Cleanup complete. Exiting...")
+    rr.shutdown()
     os._exit(0)
 
+def _resolve_python_exec():
+    # Prefer the interpreter that runs this process, else project .venv, else PATH lookup
+    project_venv = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.venv', 'Scripts', 'python.exe'))
+    python_exec = sys.executable if getattr(sys, 'executable', None) else None
+    if not python_exec and os.path.exists(project_venv):
+        python_exec = project_venv
+    if not python_exec:
+        python_exec = shutil.which('python') or shutil.which('python3')
+    if not python_exec:
+        rr.log_error('No Python executable found to start capture subprocess')
+        return None
+    # If python_exec is not absolute, try to resolve via which
+    if not os.path.isabs(python_exec):
+        python_exec = shutil.which(python_exec) or python_exec
+    if not os.path.exists(python_exec):
+        rr.log_error(f"Resolved python executable does not exist: {python_exec}")
+        return None
+    rr.log_info(f'Resolved python executable for capture: {python_exec}')
+    return python_exec
+
+# Capture subprocess launch settings, resolved once at startup
+_PYTHON_EXEC = _resolve_python_exec()
+# Capture script lives in modules/
+_CAPTURE_SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'modules', 'capture_xpath.py'))
+# Driver should be in the project's drivers folder (same level as main.py)
+_DRIVER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'drivers', 'msedgedriver.exe'))
+_CAPTURE_ENV = dict(os.environ,
+                    PYTHONUNBUFFERED="1",
+                    EDGE_LOG_FILE="NUL",
+                    EDGE_SUPPRESS_WARNINGS="1")
+
 # Update capture_xpath endpoint to store driver
 @app.route('/api/capture_xpath', methods=['POST'])
 def api_capture_xpath():
-    import subprocess
-    import sys
-    import time
-    global capture_process, capture_active, selenium_start_time
+    global capture_process, capture_active, capture_job
     
     if capture_active:
         return jsonify({
@@ -197,65 +439,40 @@ def api_capture_xpath():
         })
     
     try:
-        # Resolve python executable: prefer current interpreter (sys.executable), else project .venv, else PATH lookup
-        import shutil
-        project_venv = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.venv', 'Scripts', 'python.exe'))
-        # Prefer the interpreter that runs this process
-        python_exec = sys.executable if getattr(sys, 'executable', None) else None
-        if not python_exec and os.path.exists(project_venv):
-            python_exec = project_venv
-        if not python_exec:
-            # Try to resolve 'python' on PATH
-            python_on_path = shutil.which('python') or shutil.which('python3')
-            if python_on_path:
-                python_exec = python_on_path
-        if not python_exec:
-            rr.log_error('No Python executable found to start capture subprocess')
+        if not _PYTHON_EXEC:
             raise FileNotFoundError('No Python executable found to start capture subprocess')
-        # If python_exec is not absolute, try to resolve via which
-        if not os.path.isabs(python_exec):
-            resolved = shutil.which(python_exec)
-            if resolved:
-                python_exec = resolved
-        rr.log_info(f'Resolved python executable for capture: {python_exec}')
-        # Capture script lives in modules/
-        script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'modules', 'capture_xpath.py'))
-        if not os.path.exists(script_path):
-            rr.log_error(f"Capture script not found at {script_path}")
-            raise FileNotFoundError(f"Capture script not found at {script_path}")
-        # Driver should be in the project's drivers folder (same level as main.py)
-        driver_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'drivers', 'msedgedriver.exe'))
-        if not os.path.exists(driver_path):
-            rr.log_error(f"Edge WebDriver not found at {driver_path}")
-            raise FileNotFoundError(f"Edge WebDriver not found at {driver_path}")
- 
-        selenium_start_time = time.time()
+        if not os.path.exists(_CAPTURE_SCRIPT_PATH):
+            rr.log_error(f"Capture script not found at {_CAPTURE_SCRIPT_PATH}")
+            raise FileNotFoundError(f"Capture script not found at {_CAPTURE_SCRIPT_PATH}")
+        # Checked per call since the driver may be dropped into drivers/ while the app is running
+        if not os.path.exists(_DRIVER_PATH):
+            rr.log_error(f"Edge WebDriver not found at {_DRIVER_PATH}")
+            raise FileNotFoundError(f"Edge WebDriver not found at {_DRIVER_PATH}")
  
         # Use project-local logs folder
         logs_dir = os.path.join(os.path.dirname(__file__), 'logs')
         os.makedirs(logs_dir, exist_ok=True)
  
-        stdout_log = open(os.path.join(logs_dir, 'capture_stdout.log'), 'w')
-        stderr_log = open(os.path.join(logs_dir, 'capture_stderr.log'), 'w')
- 
         # Pass driver path and browser type to the script
         # Run as a module so package imports (modules.*) work correctly in the subprocess.
-        cmd = [python_exec, '-m', 'modules.capture_xpath', '--browser', 'edge', '--driver', driver_path]
+        cmd = [_PYTHON_EXEC, '-m', 'modules.capture_xpath', '--browser', 'edge', '--driver', _DRIVER_PATH]
         rr.log_info(f"Starting capture subprocess with command: {cmd}")
-        if not os.path.exists(python_exec):
-            rr.log_error(f"Resolved python executable does not exist: {python_exec}")
-            raise FileNotFoundError(f"Python executable not found: {python_exec}")
-        capture_process = subprocess.Popen(
-            cmd,
-            stdout=stdout_log,
-            stderr=stderr_log,
-            env=dict(os.environ,
-                    PYTHONUNBUFFERED="1",
-                    EDGE_LOG_FILE="NUL",
-                    EDGE_SUPPRESS_WARNINGS="1"),
-            text=True,
-            cwd=os.path.dirname(__file__)
-        )
+        # Append so earlier sessions' logs are kept. The child inherits its own copies of these
+        # descriptors, so ours are closed as soon as it has started instead of leaking per capture.
+        with open(os.path.join(logs_dir, 'capture_stdout.log'), 'ab') as stdout_log, \
+                open(os.path.join(logs_dir, 'capture_stderr.log'), 'ab') as stderr_log:
+            capture_process = subprocess.Popen(
+                cmd,
+                stdout=stdout_log,
+                stderr=stderr_log,
+                env=_CAPTURE_ENV,
+                text=True,
+                cwd=os.path.dirname(__file__),
+                # New session/process group so the whole tree can be killed with os.killpg
+                start_new_session=(os.name != 'nt')
+            )
+        if os.name == 'nt':
+            capture_job = _create_capture_job(capture_process)
         capture_active = True
         rr.log_info(f"Capture subprocess started with PID: {capture_process.pid}")
         return jsonify({
@@ -268,11 +485,9 @@ def api_capture_xpath():
         rr.log_error(f"Error starting capture subprocess: {e}")
         if capture_process:
             capture_process.terminate()
+            cleanup_selenium_processes()
         capture_process = None
         capture_active = False
-        selenium_start_time = None
-        if 'stdout_log' in locals(): stdout_log.close()
-        if 'stderr_log' in locals(): stderr_log.close()
         return jsonify({
             'success': False,
             'error': f'Failed to start capture: {str(e)}'
@@ -281,9 +496,7 @@ def api_capture_xpath():
 
 @app.route('/api/stop_capture', methods=['POST'])
 def api_stop_capture():
-    import psutil
-    import time
-    global capture_process, capture_active, selenium_start_time
+    global capture_process, capture_active
     
     if not capture_active:
         return jsonify({
@@ -292,45 +505,24 @@ def api_stop_capture():
         })
         
     try:
-        # Only kill ChromeDriver/Selenium processes
-        killed_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'create_time']):
-            try:
-                # Only kill processes created after we started Selenium
-                if selenium_start_time and proc.create_time() > selenium_start_time:
-                    pname = proc.name().lower()
-                    if any(driver in pname for driver in ['chromedriver', 'msedgedriver', 'geckodriver']):
-                        proc.kill()
-                        killed_processes.append(pname)
-                    elif any(browser in pname for browser in ['chrome', 'msedge', 'firefox']):
-                        # For browsers, check if it's a Selenium instance
-                        cmdline = ' '.join(proc.cmdline()).lower()
-                        if 'selenium' in cmdline or '--remote-debugging-port' in cmdline:
-                            proc.kill()
-                            killed_processes.append(pname)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-            
         # Terminate the capture process
         if capture_process and capture_process.poll() is None:
             capture_process.terminate()
-            try:
-                capture_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not _wait_proc(capture_process, 5):
                 capture_process.kill()
+        # Then kill whatever Selenium drivers/browsers it left behind
+        cleanup_selenium_processes()
             
         capture_process = None
         capture_active = False
-        selenium_start_time = None
         
         return jsonify({
             'success': True,
-            'message': f'Capture stopped successfully. Killed processes: {", ".join(killed_processes)}',
+            'message': 'Capture stopped successfully',
             'status': 'stopped'
         })
         
     except Exception as e:
-        import traceback
         return jsonify({
             'success': False,
             'error': f'Error stopping capture: {str(e)}\n{traceback.format_exc()}'
@@ -339,7 +531,7 @@ def api_stop_capture():
 
 @app.route('/api/rename_json', methods=['POST'])
 def api_rename_json():
-    req = request.json
+    req = request.get_json(cache=True)
     old = req.get('old')
     new = req.get('new')
     if not old or not new or old == new:
@@ -352,36 +544,39 @@ def api_rename_json():
         if os.path.exists(new_path):
             return jsonify({'success': False, 'error': 'New file already exists'})
         os.rename(old_path, new_path)
+        _json_cache.pop(old, None)
+        # Keep the renamed page at its position in the display order, dropping any stale
+        # entry for the new name (e.g. a file removed outside the app)
+        order = _load_order_manifest()
+        updated = [new if f == old else f for f in order if f != new]
+        if updated != order:
+            _save_order_manifest(updated)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
     
 @app.route('/api/update_xpath', methods=['POST'])
 def api_update_xpath():
-    req = request.json
+    req = request.get_json(cache=True)
     page = req['page']
     idx = req['index']
     new_xpath = req['xpath']
     fpath = os.path.join(CAPTURED_XPATHS_DIR, page)
     try:
-        with open(fpath, 'r', encoding='utf-8') as f:
-            arr = json.load(f)
+        arr = _load_page(page, fpath)
         if 0 <= idx < len(arr):
             arr[idx].setdefault('selectors', {})['xpath'] = new_xpath
-            with open(fpath, 'w', encoding='utf-8') as f:
-                json.dump(arr, f, indent=2, ensure_ascii=False)
+            _store_page(page, fpath, arr)
             return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
     return jsonify({'success': False, 'error': 'Invalid index'})
 
 def open_browser(url):
-    import time
     global ui_browser_pid, ui_browser_start_time
     ui_browser_start_time = time.time()
     
     try:
-        import webbrowser
         webbrowser.open_new_tab(url)
     except Exception as e:
         print(f"Error opening browser: {e}")
@@ -393,17 +588,23 @@ def api_delete_json():
         if not request.is_json:
             return jsonify({'success': False, 'error': 'Content-Type must be application/json'})
         
-        data = request.get_json()
-        if not data or 'file' not in data:
+        req = request.get_json(cache=True)
+        if not req or 'file' not in req:
             return jsonify({'success': False, 'error': 'Missing file parameter'})
         
-        fname = data['file']
+        fname = req['file']
         fpath = os.path.join(CAPTURED_XPATHS_DIR, fname)
         
         if not os.path.exists(fpath):
             return jsonify({'success': False, 'error': 'File not found'})
             
         os.remove(fpath)
+        _json_cache.pop(fname, None)
+        # Drop the page from the display order so a later file with the same name starts fresh
+        order = _load_order_manifest()
+        if fname in order:
+            order.remove(fname)
+            _save_order_manifest(order)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -414,27 +615,25 @@ def api_delete_field():
         if not request.is_json:
             return jsonify({'success': False, 'error': 'Content-Type must be application/json'})
             
-        data = request.get_json()
-        if not data or 'page' not in data or 'index' not in data:
+        req = request.get_json(cache=True)
+        if not req or 'page' not in req or 'index' not in req:
             return jsonify({'success': False, 'error': 'Missing required parameters'})
             
-        page = data['page']
-        idx = int(data['index'])
+        page = req['page']
+        idx = int(req['index'])
         fpath = os.path.join(CAPTURED_XPATHS_DIR, page)
         
         if not os.path.exists(fpath):
             return jsonify({'success': False, 'error': 'File not found'})
             
-        with open(fpath, 'r', encoding='utf-8') as f:
-            arr = json.load(f)
+        arr = _load_page(page, fpath)
             
         if not (0 <= idx < len(arr)):
             return jsonify({'success': False, 'error': 'Invalid index'})
             
         arr.pop(idx)
         
-        with open(fpath, 'w', encoding='utf-8') as f:
-            json.dump(arr, f, indent=2, ensure_ascii=False)
+        _store_page(page, fpath, arr)
             
         return jsonify({'success': True})
     except Exception as e:
@@ -491,7 +690,7 @@ def api_validate_xpaths():
                 'error': 'Start capture process first to validate XPaths'
             })
             
-        req = request.get_json()
+        req = request.get_json(cache=True)
         if not req or 'file' not in req:
             return jsonify({'success': False, 'error': 'Missing file parameter'})
             
@@ -508,14 +707,11 @@ def api_validate_xpaths():
         return jsonify({'success': False, 'error': str(e)})
     
 
-# Handle graceful exit on Ctrl+C
-signal.signal(signal.SIGINT, signal_handler)
-
 if __name__ == '__main__':
     port = 5005
     url = f'http://127.0.0.1:{port}/'
     
-    # Register signal handlers
+    # Register signal handlers (graceful exit on Ctrl+C)
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
@@ -524,5 +720,3 @@ if __name__ == '__main__':
         open_browser(url)
     
     app.run(port=port, debug=True)
-    import webbrowser
-    webbrowser.open(url)
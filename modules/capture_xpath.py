@@ -549,8 +549,10 @@ def capture_elements(driver, selectors_list):
     if not is_duplicate:
         try:
             existing_data.append(details)
-            with open(page_json, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            # Serialize fully first so the file is written with a single write() call
+            payload = json.dumps(existing_data, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(page_json, 'wb') as f:
+                f.write(payload)
             rr.log_info(f'Details appended to {page_json}')
             print(f'Details appended to {page_json}')
         except Exception as e:
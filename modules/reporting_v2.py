@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 import os
 from selenium import webdriver
@@ -7,6 +10,16 @@ from string import Template
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 
+# The log format never uses caller, thread or process fields; skip collecting them per record
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+_logger = logging.getLogger('robust_reporting')
+_queue_handler = None
+_listener = None
+
 class RobustReporting:
     def __init__(self):
         self.values_dict = {}
@@ -15,21 +28,45 @@ class RobustReporting:
 
     def _init_logging(self):
         """Initialize enhanced logging system"""
-        log_dir = os.path.join(PROJECT_ROOT, 'Logs')
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(
-            log_dir, f"execution_{datetime.now().strftime('%Y%m%d')}.log")
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger('robust_reporting')
+        global _queue_handler, _listener
+        # Several modules create a RobustReporting; set up the handlers only once per process
+        if _queue_handler is None:
+            log_dir = os.path.join(PROJECT_ROOT, 'Logs')
+            os.makedirs(log_dir, exist_ok=True)
+            log_file = os.path.join(
+                log_dir, f"execution_{datetime.now().strftime('%Y%m%d')}.log")
+
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            # File and console writes happen on the listener thread, not the caller's
+            log_queue = queue.SimpleQueue()
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+            # Only merge args into the message here; the listener's handlers apply the full format
+            _queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
+            _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+        self.logger = _logger
 
+    def shutdown(self):
+        """Flush queued log records; needed before os._exit, which skips atexit"""
+        global _listener
+        if _listener is None:
+            return
+        listener, _listener = _listener, None
+        atexit.unregister(listener.stop)
+        listener.stop()
+        # Later records go straight to the handlers instead of a queue nobody drains
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
 
     def log_info(self, message):
         """Log informational message"""